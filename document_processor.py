@@ -1,7 +1,21 @@
 import os
-from langchain_community.document_loaders import PyPDFLoader, TextLoader  # Updated import
+from langchain_community.document_loaders import TextLoader  # Updated import
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from typing import List
+from langchain.schema import Document
+from pypdf import PdfReader
+from typing import Iterator, List
+
+def iter_pdf_pages(file_path) -> Iterator[Document]:
+    """Yield one Document per PDF page, extracting text only when the page is reached"""
+    # PyPDFLoader in the pinned langchain-community extracts every page up
+    # front, so pages are read straight from pypdf instead.
+    with open(file_path, 'rb') as f:
+        reader = PdfReader(f)
+        for i, page in enumerate(reader.pages):
+            yield Document(
+                page_content=page.extract_text(),
+                metadata={"source": file_path, "page": i},
+            )
 
 class SIBDocumentProcessor:
     def __init__(self, chunk_size=1000, chunk_overlap=200):
@@ -15,45 +29,60 @@ class SIBDocumentProcessor:
     
     def load_sib_documents(self, data_folder="sib_data"):
         """Load all South Indian Bank documents"""
-        documents = []
+        chunks = list(self.iter_sib_chunks(data_folder))
+        
+        if not chunks:
+            print("No documents found! Please add SIB documents to the sib_data folder.")
+            return []
         
+        print(f"Successfully processed {len(chunks)} chunks")
+        return chunks
+    
+    def iter_sib_chunks(self, data_folder="sib_data") -> Iterator[Document]:
+        """Yield SIB chunks one page at a time without loading whole files.
+        
+        If a file fails partway through, chunks from its earlier pages have
+        already been yielded; the error message reports how many pages made it.
+        """
         if not os.path.exists(data_folder):
             print(f"Creating {data_folder} directory...")
             os.makedirs(data_folder)
             print("Please add your SIB documents to this folder and run again.")
-            return []
+            return
         
-        for filename in os.listdir(data_folder):
+        for filename in sorted(os.listdir(data_folder)):
             file_path = os.path.join(data_folder, filename)
             
+            page_count = 0
             try:
                 if filename.endswith('.pdf'):
-                    loader = PyPDFLoader(file_path)
-                    docs = loader.load()
-                    documents.extend(docs)
-                    print(f"Loaded PDF: {filename}")
+                    pages = iter_pdf_pages(file_path)
                 elif filename.endswith('.txt'):
-                    loader = TextLoader(file_path, encoding='utf-8')
-                    docs = loader.load()
-                    documents.extend(docs)
-                    print(f"Loaded text file: {filename}")
+                    pages = TextLoader(file_path, encoding='utf-8').load()
+                else:
+                    continue
+                
+                for page in pages:
+                    for chunk in self.text_splitter.split_documents([page]):
+                        # Add metadata to identify SIB-specific content
+                        chunk.metadata['source_type'] = 'south_indian_bank'
+                        chunk.metadata['domain'] = 'banking'
+                        yield chunk
+                    page_count += 1
+                print(f"Loaded {filename} ({page_count} page(s))")
             except Exception as e:
-                print(f"Error loading {filename}: {e}")
-        
-        if not documents:
-            print("No documents found! Please add SIB documents to the sib_data folder.")
-            return []
-        
-        # Split documents into chunks
-        chunks = self.text_splitter.split_documents(documents)
-        
-        # Add metadata to identify SIB-specific content
-        for chunk in chunks:
-            chunk.metadata['source_type'] = 'south_indian_bank'
-            chunk.metadata['domain'] = 'banking'
-        
-        print(f"Successfully processed {len(chunks)} chunks from {len(documents)} documents")
-        return chunks
+                print(f"Error loading {filename} after {page_count} page(s): {e}")
+    
+    def iter_sib_chunk_batches(self, data_folder="sib_data", batch_size=64) -> Iterator[List[Document]]:
+        """Group streamed chunks into fixed-size batches for the indexing sink"""
+        batch = []
+        for chunk in self.iter_sib_chunks(data_folder):
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 if __name__ == "__main__":
     processor = SIBDocumentProcessor()
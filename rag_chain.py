@@ -1,4 +1,5 @@
 from langchain_community.llms import Ollama
+from pypdf import PdfReader
 import time
 import os
 import glob
@@ -48,6 +49,21 @@ class SIBRAGChain:
             except Exception as e:
                 print(f"  ⚠️ Error loading {file_path}: {e}")
         
+        # PDFs are extracted page by page; later pages are never read once the preview is filled
+        for file_path in glob.glob(os.path.join(sib_folder, "*.pdf")):
+            try:
+                filename = os.path.basename(file_path)
+                text = ""
+                with open(file_path, 'rb') as f:
+                    for page in PdfReader(f).pages:
+                        text += page.extract_text()
+                        if len(text) >= 2000:
+                            break
+                content[filename] = text[:2000]  # First 2000 chars per file
+                print(f"  ✅ Loaded: {filename}")
+            except Exception as e:
+                print(f"  ⚠️ Error loading {file_path}: {e}")
+        
         return content
     
     def query(self, question):
@@ -0,0 +1,45 @@
+import os
+
+import document_processor
+from document_processor import SIBDocumentProcessor
+from vector_store import SIBVectorStore
+
+
+class FakePage:
+    def __init__(self, index, extracted):
+        self.index = index
+        self.extracted = extracted
+
+    def extract_text(self):
+        self.extracted.append(self.index)
+        return f"South Indian Bank annual report page {self.index}"
+
+
+def test_pdf_pages_are_extracted_one_at_a_time(tmp_path, monkeypatch):
+    extracted = []
+
+    class FakePdfReader:
+        def __init__(self, stream):
+            self.pages = [FakePage(i, extracted) for i in range(3)]
+
+    monkeypatch.setattr(document_processor, "PdfReader", FakePdfReader)
+    (tmp_path / "annual_report.pdf").write_bytes(b"%PDF-1.4")
+
+    chunks = SIBDocumentProcessor().iter_sib_chunks(str(tmp_path))
+
+    first = next(chunks)
+    assert extracted == [0]
+    assert first.metadata["page"] == 0
+    assert first.metadata["source_type"] == "south_indian_bank"
+
+    rest = list(chunks)
+    assert extracted == [0, 1, 2]
+    assert [chunk.metadata["page"] for chunk in rest] == [1, 2]
+
+
+def test_streaming_vectorstore_skips_empty_corpus(tmp_path):
+    persist_directory = str(tmp_path / "sib_vectordb")
+    vs = SIBVectorStore(persist_directory=persist_directory)
+
+    assert vs.create_vectorstore_streaming(iter([])) is None
+    assert not os.path.exists(persist_directory)
@@ -2,6 +2,7 @@ from langchain_community.vectorstores import Chroma  # Updated import
 from langchain_community.embeddings import OllamaEmbeddings  # Updated import
 import chromadb
 from chromadb.config import Settings
+import itertools
 import os
 
 class SIBVectorStore:
@@ -35,6 +36,38 @@ class SIBVectorStore:
         print(f"Vector store created at: {self.persist_directory}")
         return vectorstore
     
+    def create_vectorstore_streaming(self, chunk_batches):
+        """Create vector store by embedding chunk batches as they are produced.
+        
+        Each batch is embedded and persisted before the next one is pulled
+        from the iterator, so only one batch is held in memory at a time.
+        Returns None without touching disk if the iterator yields nothing.
+        """
+        chunk_batches = iter(chunk_batches)
+        first_batch = next(chunk_batches, None)
+        if not first_batch:
+            return None
+        
+        print("Creating vector store (streaming)... This may take a few minutes.")
+        
+        os.makedirs(self.persist_directory, exist_ok=True)
+        
+        vectorstore = Chroma(
+            persist_directory=self.persist_directory,
+            embedding_function=self.embeddings,
+            collection_name="sib_knowledge_base"
+        )
+        
+        total = 0
+        for batch in itertools.chain([first_batch], chunk_batches):
+            vectorstore.add_documents(batch)
+            total += len(batch)
+            print(f"  Indexed {total} chunks...")
+        
+        vectorstore.persist()
+        print(f"Vector store created at: {self.persist_directory} ({total} chunks)")
+        return vectorstore
+    
     def load_vectorstore(self):
         """Load existing vector store"""
         if os.path.exists(self.persist_directory):
@@ -50,14 +83,13 @@ class SIBVectorStore:
 if __name__ == "__main__":
     from document_processor import SIBDocumentProcessor
     
-    # Process documents
+    # Process documents page by page and index them as they stream in
     processor = SIBDocumentProcessor()
-    documents = processor.load_sib_documents()
+    vs = SIBVectorStore()
+    
+    vectorstore = vs.create_vectorstore_streaming(processor.iter_sib_chunk_batches())
     
-    if documents:
-        # Create vector store
-        vs = SIBVectorStore()
-        vectorstore = vs.create_vectorstore(documents)
+    if vectorstore is not None:
         print("Vector store creation completed successfully!")
     else:
         print("No documents to process. Add documents to sib_data folder first.")